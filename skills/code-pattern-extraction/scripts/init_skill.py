@@ -12,10 +12,23 @@ Examples:
 
 import argparse
 import os
-import re
+import string
 import sys
 from pathlib import Path
 
+_SKILL_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + '-')
+
+
+def _is_valid_skill_name(name: str) -> bool:
+    """Check name format without a regex: [a-z0-9] segments joined by single hyphens."""
+    return (
+        bool(name)
+        and not name.startswith('-')
+        and not name.endswith('-')
+        and '--' not in name
+        and set(name) <= _SKILL_NAME_CHARS
+    )
+
 
 def validate_skill_name(name: str) -> tuple[bool, str]:
     """Validate skill name against Agent Skills specification."""
@@ -25,48 +38,23 @@ def validate_skill_name(name: str) -> tuple[bool, str]:
     if len(name) > 64:
         return False, f"Name must be 64 characters or less (got {len(name)})"
 
-    if not re.match(r'^[a-z0-9]+(-[a-z0-9]+)*$', name):
+    if not _is_valid_skill_name(name):
         return False, "Name must be lowercase letters, numbers, and hyphens only. Cannot start/end with hyphen or have consecutive hyphens."
 
     return True, ""
 
 
-def create_skill_md(skill_name: str, resources: list[str]) -> str:
-    """Generate SKILL.md template content."""
-
-    # Build references section if references are included
-    references_section = ""
-    if "references" in resources:
-        references_section = """
-## References
-
-For detailed information, see:
-- [REFERENCE.md](references/REFERENCE.md) - Detailed technical reference
-
-<!-- TODO: Add references as needed -->
-"""
-
-    # Build scripts section if scripts are included
-    scripts_section = ""
-    if "scripts" in resources:
-        scripts_section = """
-## Scripts
-
-Available utility scripts:
-- `scripts/example.py` - Example script (TODO: replace or remove)
-
-<!-- TODO: Add script documentation as needed -->
-"""
-
-    template = f'''---
-name: {skill_name}
+# SKILL.md scaffold pieces, built once at import; create_skill_md joins
+# them with the optional sections for the requested resources
+_SKILL_MD_HEAD = '''---
+name: {name}
 description: TODO - Describe what this skill does AND when to use it. Include keywords that help agents identify relevant tasks. (Max 1024 characters)
 metadata:
   author: TODO
   version: "1.0"
 ---
 
-# {skill_name.replace("-", " ").title()}
+# {title}
 
 ## Problem Statement
 
@@ -103,7 +91,27 @@ metadata:
 ```yaml
 # TODO: Add configuration if needed
 ```
-{references_section}{scripts_section}
+'''
+
+_REFERENCES_SECTION = """
+## References
+
+For detailed information, see:
+- [REFERENCE.md](references/REFERENCE.md) - Detailed technical reference
+
+<!-- TODO: Add references as needed -->
+"""
+
+_SCRIPTS_SECTION = """
+## Scripts
+
+Available utility scripts:
+- `scripts/example.py` - Example script (TODO: replace or remove)
+
+<!-- TODO: Add script documentation as needed -->
+"""
+
+_SKILL_MD_TAIL = '''
 ## Testing Strategy
 
 ### Unit Tests
@@ -128,7 +136,16 @@ metadata:
 
 - <!-- TODO: Link to related skills -->
 '''
-    return template
+
+
+def create_skill_md(skill_name: str, resources: list[str]) -> str:
+    """Generate SKILL.md template content."""
+    return "".join([
+        _SKILL_MD_HEAD.format(name=skill_name, title=skill_name.replace("-", " ").title()),
+        _REFERENCES_SECTION if "references" in resources else "",
+        _SCRIPTS_SECTION if "scripts" in resources else "",
+        _SKILL_MD_TAIL,
+    ])
 
 
 def create_reference_template() -> str:
@@ -154,6 +171,10 @@ def create_reference_template() -> str:
 '''
 
 
+# Skill-name independent, so encoded once rather than on every init
+_REFERENCE_BYTES = create_reference_template().encode("utf-8")
+
+
 def create_script_template(skill_name: str) -> str:
     """Generate example script template."""
     return f'''#!/usr/bin/env python3
@@ -181,6 +202,17 @@ if __name__ == "__main__":
 '''
 
 
+def _write_file(path: Path, data: bytes, mode: int = 0o666) -> None:
+    """Create a new file with its final mode set at open time (no separate chmod).
+
+    The umask applies to mode, as with open(); the default matches write_text().
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    # fdopen owns the descriptor and its write() retries short writes
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+
+
 def init_skill(skill_name: str, output_path: str, resources: list[str]) -> None:
     """Initialize a new skill directory."""
 
@@ -193,38 +225,39 @@ def init_skill(skill_name: str, output_path: str, resources: list[str]) -> None:
     # Create skill directory
     skill_dir = Path(output_path) / skill_name
 
-    if skill_dir.exists():
+    # Create every directory up front; mkdir itself reports an existing
+    # skill directory, so there is no separate exists() check to race with
+    try:
+        skill_dir.mkdir(parents=True)
+    except FileExistsError:
         print(f"Error: Skill directory already exists: {skill_dir}")
         sys.exit(1)
-
-    skill_dir.mkdir(parents=True)
+    for dirname in ("scripts", "references", "assets"):
+        if dirname in resources:
+            (skill_dir / dirname).mkdir()
     print(f"Created skill directory: {skill_dir}")
 
     # Create SKILL.md
     skill_md_path = skill_dir / "SKILL.md"
-    skill_md_path.write_text(create_skill_md(skill_name, resources))
+    _write_file(skill_md_path, create_skill_md(skill_name, resources).encode("utf-8"))
     print(f"Created: {skill_md_path}")
 
     # Create optional resource directories
     if "scripts" in resources:
         scripts_dir = skill_dir / "scripts"
-        scripts_dir.mkdir()
         script_path = scripts_dir / "example.py"
-        script_path.write_text(create_script_template(skill_name))
-        script_path.chmod(0o755)
+        _write_file(script_path, create_script_template(skill_name).encode("utf-8"), mode=0o755)
         print(f"Created: {scripts_dir}/")
 
     if "references" in resources:
         refs_dir = skill_dir / "references"
-        refs_dir.mkdir()
         ref_path = refs_dir / "REFERENCE.md"
-        ref_path.write_text(create_reference_template())
+        _write_file(ref_path, _REFERENCE_BYTES)
         print(f"Created: {refs_dir}/")
 
     if "assets" in resources:
         assets_dir = skill_dir / "assets"
-        assets_dir.mkdir()
-        (assets_dir / ".gitkeep").touch()
+        _write_file(assets_dir / ".gitkeep", b"")
         print(f"Created: {assets_dir}/")
 
     print(f"\n✅ Skill '{skill_name}' initialized successfully!")
@@ -13,11 +13,44 @@ Examples:
 import argparse
 import os
 import re
+import shutil
+import string
 import sys
+import time
 import zipfile
 from pathlib import Path
+from typing import Optional
 
-import yaml
+# PyYAML is optional: simple frontmatter is parsed by _parse_frontmatter,
+# and yaml is only needed for anything outside that subset
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+if yaml is not None:
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+
+_SKILL_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + '-')
+_FM_END_RE = re.compile(rb'\n---\s*\n')
+_TODO_RE = re.compile(rb'<!--\s*TODO|#\s*TODO')
+_FM_LINE_RE = re.compile(r'([A-Za-z_][\w-]*):(?: +(.*))?\Z')
+# Plain scalars YAML would resolve to bool/null under YAML 1.1
+_YAML_KEYWORDS = frozenset({'true', 'false', 'yes', 'no', 'on', 'off', 'y', 'n', 'null', '~'})
+# Phrases showing a description says WHEN to use the skill
+_WHEN_RE = re.compile(r'use when|use for|when the user|when you need|triggers when')
+
+# Already-compressed formats gain nothing from DEFLATE, so store them as-is
+_COMPRESSED_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.pdf',
+    '.zip', '.gz', '.mp4', '.mp3', '.woff2',
+})
+
+# Files up to this size are read in one call; larger ones are streamed
+_SLURP_LIMIT = 1024 * 1024
 
 
 class ValidationError:
@@ -26,6 +59,17 @@ class ValidationError:
         self.severity = severity  # "error" or "warning"
 
 
+def _is_valid_skill_name(name: str) -> bool:
+    """Check name format without a regex: [a-z0-9] segments joined by single hyphens."""
+    return (
+        bool(name)
+        and not name.startswith('-')
+        and not name.endswith('-')
+        and '--' not in name
+        and set(name) <= _SKILL_NAME_CHARS
+    )
+
+
 def validate_skill_name(name: str, directory_name: str) -> list[ValidationError]:
     """Validate skill name against Agent Skills specification."""
     errors = []
@@ -37,7 +81,7 @@ def validate_skill_name(name: str, directory_name: str) -> list[ValidationError]
     if len(name) > 64:
         errors.append(ValidationError(f"name must be 64 characters or less (got {len(name)})"))
 
-    if not re.match(r'^[a-z0-9]+(-[a-z0-9]+)*$', name):
+    if not _is_valid_skill_name(name):
         errors.append(ValidationError(
             "name must be lowercase letters, numbers, and hyphens only. "
             "Cannot start/end with hyphen or have consecutive hyphens."
@@ -77,9 +121,7 @@ def validate_description(description: str) -> list[ValidationError]:
         errors.append(ValidationError("description contains TODO placeholder"))
 
     # Check for "when to use" indicators
-    when_indicators = ["use when", "use for", "when the user", "when you need", "triggers when"]
-    has_when = any(indicator in desc_lower for indicator in when_indicators)
-    if not has_when:
+    if not _WHEN_RE.search(desc_lower):
         errors.append(ValidationError(
             "description should explain WHEN to use the skill (e.g., 'Use when...')",
             severity="warning"
@@ -88,31 +130,112 @@ def validate_description(description: str) -> list[ValidationError]:
     return errors
 
 
-def validate_frontmatter(content: str, directory_name: str) -> tuple[dict, list[ValidationError]]:
+def _parse_scalar(value: str):
+    """Return a frontmatter value as str, or None if YAML could read it differently."""
+    if value.startswith('"'):
+        inner = value[1:-1]
+        if len(value) < 2 or not value.endswith('"') or '"' in inner or '\\' in inner:
+            return None
+        return inner
+    if value.startswith("'"):
+        inner = value[1:-1]
+        if len(value) < 2 or not value.endswith("'") or "'" in inner.replace("''", ""):
+            return None
+        return inner.replace("''", "'")
+    if (
+        not value
+        or value[0] in '[]{}&*!|>%@`#,?:-+.~=<' or value[0].isdigit()
+        or ': ' in value or ' #' in value or value.endswith(':')
+        or value.lower() in _YAML_KEYWORDS
+    ):
+        return None
+    return value
+
+
+def _parse_frontmatter(raw: bytes) -> Optional[dict]:
+    """Parse flat key: value frontmatter with one level of nested mappings.
+
+    Returns None for anything outside that subset (block scalars, lists,
+    flow syntax, non-string plain scalars...) so the caller can fall back
+    to yaml.
+    """
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+    result = {}
+    parent = None  # mapping that indented lines belong to
+    indent = None
+    for line in text.split('\n'):
+        line = line.rstrip('\r')
+        stripped = line.strip(' ')
+        if not stripped or stripped.startswith('#'):
+            continue
+        if not line.isprintable():
+            return None
+
+        depth = len(line) - len(line.lstrip(' '))
+        match = _FM_LINE_RE.match(stripped.rstrip(' '))
+        if not match or match.group(1).lower() in _YAML_KEYWORDS:
+            return None
+        key, value = match.groups()
+
+        if depth == 0:
+            if value is None:
+                parent, indent = {}, None
+                result[key] = parent
+                continue
+            parent = None
+        elif parent is None or value is None or indent not in (None, depth):
+            return None
+        else:
+            indent = depth
+
+        value = _parse_scalar(value)
+        if value is None:
+            return None
+        (parent if depth else result)[key] = value
+
+    # An empty "key:" is null in YAML, not an empty mapping
+    for key, value in result.items():
+        if value == {}:
+            result[key] = None
+    return result or None
+
+
+def validate_frontmatter(content: bytes, directory_name: str) -> tuple[dict, list[ValidationError]]:
     """Parse and validate YAML frontmatter."""
     errors = []
 
     # Check for frontmatter delimiters
-    if not content.startswith("---"):
+    if not content.startswith(b"---"):
         errors.append(ValidationError("SKILL.md must start with YAML frontmatter (---)"))
         return {}, errors
 
     # Find end of frontmatter
-    end_match = re.search(r'\n---\s*\n', content[3:])
+    end_match = _FM_END_RE.search(content, 3)
     if not end_match:
         errors.append(ValidationError("SKILL.md frontmatter must be closed with ---"))
         return {}, errors
 
-    frontmatter_text = content[3:end_match.start() + 3]
+    frontmatter_text = content[3:end_match.start()]
 
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            errors.append(ValidationError("Frontmatter must be a YAML dictionary"))
+    frontmatter = _parse_frontmatter(frontmatter_text)
+    if frontmatter is None:
+        if yaml is None:
+            errors.append(ValidationError(
+                "Frontmatter needs a full YAML parser; install PyYAML to validate it"
+            ))
+            return {}, errors
+        try:
+            frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
+            if not isinstance(frontmatter, dict):
+                errors.append(ValidationError("Frontmatter must be a YAML dictionary"))
+                return {}, errors
+        except yaml.YAMLError as e:
+            errors.append(ValidationError(f"Invalid YAML in frontmatter: {e}"))
             return {}, errors
-    except yaml.YAMLError as e:
-        errors.append(ValidationError(f"Invalid YAML in frontmatter: {e}"))
-        return {}, errors
 
     # Validate required fields
     errors.extend(validate_skill_name(frontmatter.get("name", ""), directory_name))
@@ -129,16 +252,27 @@ def validate_frontmatter(content: str, directory_name: str) -> tuple[dict, list[
     return frontmatter, errors
 
 
-def validate_skill_md(skill_path: Path) -> list[ValidationError]:
+def _scan_dir(path: Path) -> dict[str, os.DirEntry]:
+    """Map entry names to DirEntry objects for one directory listing."""
+    with os.scandir(path) as it:
+        return {entry.name: entry for entry in it}
+
+
+def validate_skill_md(skill_path: Path, present: Optional[dict[str, os.DirEntry]] = None) -> list[ValidationError]:
     """Validate SKILL.md content."""
     errors = []
-    skill_md = skill_path / "SKILL.md"
+    if present is None:
+        present = _scan_dir(skill_path)
 
-    if not skill_md.exists():
+    skill_md = present.get("SKILL.md")
+    if skill_md is None or not skill_md.is_file():
         errors.append(ValidationError("SKILL.md file is required"))
         return errors
 
-    content = skill_md.read_text()
+    # Kept as bytes: the frontmatter parsers decode their slice and the
+    # body checks below work on bytes, so the file is never decoded whole
+    with open(skill_md.path, 'rb') as f:
+        content = f.read()
     directory_name = skill_path.name
 
     # Validate frontmatter
@@ -146,16 +280,16 @@ def validate_skill_md(skill_path: Path) -> list[ValidationError]:
     errors.extend(fm_errors)
 
     # Check line count
-    lines = content.split('\n')
-    if len(lines) > 500:
+    line_count = content.count(b'\n') + 1
+    if line_count > 500:
         errors.append(ValidationError(
-            f"SKILL.md should be under 500 lines (got {len(lines)}). "
+            f"SKILL.md should be under 500 lines (got {line_count}). "
             "Consider moving content to references/",
             severity="warning"
         ))
 
     # Check for TODO placeholders in body
-    if "<!-- TODO" in content or "# TODO" in content:
+    if _TODO_RE.search(content):
         errors.append(ValidationError(
             "SKILL.md contains TODO placeholders that should be filled in",
             severity="warning"
@@ -164,14 +298,16 @@ def validate_skill_md(skill_path: Path) -> list[ValidationError]:
     return errors
 
 
-def validate_structure(skill_path: Path) -> list[ValidationError]:
+def validate_structure(skill_path: Path, present: Optional[dict[str, os.DirEntry]] = None) -> list[ValidationError]:
     """Validate skill directory structure."""
     errors = []
+    if present is None:
+        present = _scan_dir(skill_path)
 
     # Check for disallowed files
     disallowed = ["README.md", "CHANGELOG.md", "INSTALLATION_GUIDE.md", "QUICK_REFERENCE.md"]
     for filename in disallowed:
-        if (skill_path / filename).exists():
+        if filename in present:
             errors.append(ValidationError(
                 f"'{filename}' should not be included in a skill. "
                 "All documentation should be in SKILL.md or references/"
@@ -179,58 +315,124 @@ def validate_structure(skill_path: Path) -> list[ValidationError]:
 
     # Check resource directories
     for dirname in ["scripts", "references", "assets"]:
-        dir_path = skill_path / dirname
-        if dir_path.exists() and not dir_path.is_dir():
+        entry = present.get(dirname)
+        if entry is not None and not entry.is_dir():
             errors.append(ValidationError(f"'{dirname}' must be a directory, not a file"))
 
     # Validate scripts are executable (Unix only)
-    scripts_dir = skill_path / "scripts"
-    if scripts_dir.exists():
-        for script in scripts_dir.glob("*.py"):
-            if not os.access(script, os.X_OK):
-                errors.append(ValidationError(
-                    f"Script '{script.name}' is not executable. Run: chmod +x {script}",
-                    severity="warning"
-                ))
+    scripts_dir = present.get("scripts")
+    if scripts_dir is not None and scripts_dir.is_dir():
+        with os.scandir(scripts_dir.path) as it:
+            for entry in it:
+                if entry.name.endswith(".py") and entry.is_file() and not entry.stat().st_mode & 0o111:
+                    errors.append(ValidationError(
+                        f"Script '{entry.name}' is not executable. Run: chmod +x {entry.path}",
+                        severity="warning"
+                    ))
 
     return errors
 
 
-def validate_skill(skill_path: Path) -> list[ValidationError]:
-    """Run all validations on a skill."""
+def validate_skill(skill_path: Path, full: bool = False) -> list[ValidationError]:
+    """Run all validations on a skill.
+
+    Structure checks are skipped once SKILL.md has errors unless full is set.
+    """
     errors = []
 
-    if not skill_path.exists():
+    # One directory listing serves every existence check below
+    try:
+        present = _scan_dir(skill_path)
+    except FileNotFoundError:
         errors.append(ValidationError(f"Skill path does not exist: {skill_path}"))
         return errors
-
-    if not skill_path.is_dir():
+    except NotADirectoryError:
         errors.append(ValidationError(f"Skill path must be a directory: {skill_path}"))
         return errors
 
-    errors.extend(validate_skill_md(skill_path))
-    errors.extend(validate_structure(skill_path))
+    errors.extend(validate_skill_md(skill_path, present))
+    if not full and any(e.severity == "error" for e in errors):
+        return errors
+    errors.extend(validate_structure(skill_path, present))
 
     return errors
 
 
-def package_skill(skill_path: Path, output_dir: Path) -> Path:
-    """Create a .skill package from the skill directory."""
+def _iter_files(root: str):
+    """Yield DirEntry objects for files under root, pruning hidden and __pycache__ entries."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.name.startswith('.') or entry.name == '__pycache__':
+                continue
+            # Symlinked directories are not followed, matching the old rglob walk
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def _compress_type_for(filename: str) -> int:
+    """Pick ZIP_STORED for already-compressed assets, ZIP_DEFLATED otherwise."""
+    if os.path.splitext(filename)[1].lower() in _COMPRESSED_EXTS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _zip_info_for(entry: os.DirEntry, arcname: str) -> zipfile.ZipInfo:
+    """Build a ZipInfo from the DirEntry's cached stat, keeping permission bits."""
+    st = entry.stat()
+    date_time = time.localtime(st.st_mtime)[:6]
+    # ZIP timestamps cover 1980-2107; clamp instead of failing on odd mtimes
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    elif date_time[0] > 2107:
+        date_time = (2107, 12, 31, 23, 59, 59)
+    info = zipfile.ZipInfo(arcname, date_time)
+    info.external_attr = (st.st_mode & 0xFFFF) << 16
+    # writestr() overwrites this with len(data); zf.open(info, 'w') reads it to
+    # decide up front whether a streamed entry needs ZIP64 headers
+    info.file_size = st.st_size
+    info.compress_type = _compress_type_for(entry.name)
+    return info
+
+
+def _write_entry(zf: zipfile.ZipFile, entry: os.DirEntry, arcname: str) -> None:
+    """Add one file to the archive, streaming it unless it is small."""
+    info = _zip_info_for(entry, arcname)
+    if entry.stat().st_size <= _SLURP_LIMIT:
+        with open(entry.path, 'rb') as f:
+            zf.writestr(info, f.read(), compresslevel=3)
+        return
+
+    # zf.open() takes the level from the ZipInfo, not from an argument
+    info._compresslevel = 3
+    with open(entry.path, 'rb') as src, zf.open(info, 'w') as dest:
+        shutil.copyfileobj(src, dest, _SLURP_LIMIT)
+
+
+def package_skill(skill_path: Path, output_dir: Path) -> tuple[Path, int]:
+    """Create a .skill package from the skill directory.
+
+    Returns the package path and its size in bytes.
+    """
     skill_name = skill_path.name
     output_file = output_dir / f"{skill_name}.skill"
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for file_path in skill_path.rglob('*'):
-            if file_path.is_file():
-                # Skip hidden files and __pycache__
-                if any(part.startswith('.') or part == '__pycache__' for part in file_path.parts):
-                    continue
-                arcname = file_path.relative_to(skill_path.parent)
-                zf.write(file_path, arcname)
+    # Own the file handle so the final size is its position after the
+    # central directory is written, with no stat afterwards
+    with open(output_file, 'wb') as fp:
+        with zipfile.ZipFile(
+            fp, 'w', zipfile.ZIP_DEFLATED,
+            allowZip64=True, compresslevel=3,
+        ) as zf:
+            for entry in _iter_files(skill_path):
+                arcname = os.path.relpath(entry.path, skill_path.parent)
+                _write_entry(zf, entry, arcname)
+        size = fp.tell()
 
-    return output_file
+    return output_file, size
 
 
 def main():
@@ -255,19 +457,18 @@ Examples:
     print(f"Validating skill: {skill_path}")
     print("-" * 50)
 
-    errors = validate_skill(skill_path)
+    # A validate-only run reports every problem; packaging stops at the first failing stage
+    errors = validate_skill(skill_path, full=args.validate_only)
 
     # Separate errors and warnings
     critical_errors = [e for e in errors if e.severity == "error"]
     warnings = [e for e in errors if e.severity == "warning"]
 
-    # Print warnings
-    for warning in warnings:
-        print(f"⚠️  Warning: {warning.message}")
-
-    # Print errors
-    for error in critical_errors:
-        print(f"❌ Error: {error.message}")
+    # Print warnings then errors in a single write
+    messages = [f"⚠️  Warning: {warning.message}" for warning in warnings]
+    messages.extend(f"❌ Error: {error.message}" for error in critical_errors)
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
 
     print("-" * 50)
 
@@ -287,9 +488,9 @@ Examples:
 
     # Package the skill
     print(f"\nPackaging skill...")
-    output_file = package_skill(skill_path, output_dir)
+    output_file, size = package_skill(skill_path, output_dir)
     print(f"✅ Created: {output_file}")
-    print(f"   Size: {output_file.stat().st_size:,} bytes")
+    print(f"   Size: {size:,} bytes")
 
 
 if __name__ == "__main__":